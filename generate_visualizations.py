@@ -11,7 +11,11 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from math import pi
 import warnings
+import json
 import os
+import time
+from datetime import datetime
+from peer_groups import PeerIndex, PEER_K, SCORE_COLS
 
 warnings.filterwarnings('ignore')
 
@@ -22,6 +26,55 @@ plt.rcParams['font.size'] = 11
 plt.rcParams['axes.titlesize'] = 14
 plt.rcParams['axes.titleweight'] = 'bold'
 
+# Compact schema for block-scale runs: applied from cleaning onwards so the
+# peak, not just the final frame, shrinks. Floats become float32 only where the
+# column's precision survives it, integers are downcast, keys become
+# categorical only where they repeat, and ranks are uint16
+COMPACT_SCHEMA = os.environ.get('DRI_COMPACT_SCHEMA', '0') == '1'
+
+# Decimal places observed in each float32 column, used to widen it back exactly
+COLUMN_PRECISION = {}
+
+def float32_precision(series, max_decimals=6):
+    """Decimal places a float series carries, if float32 stores it exactly at that precision"""
+    values = series.dropna().to_numpy(dtype=np.float64)
+    for decimals in range(max_decimals + 1):
+        if np.array_equal(values.round(decimals), values):
+            narrowed = values.astype(np.float32).astype(np.float64).round(decimals)
+            return decimals if np.array_equal(narrowed, values) else None
+    return None
+
+def compact_frame(df, skip=()):
+    """Narrow a frame's dtypes under the compact schema; returns it unchanged otherwise"""
+    if not COMPACT_SCHEMA:
+        return df
+    dtypes = {}
+    for col in df.columns:
+        series = df[col]
+        if col in skip:
+            continue
+        if series.dtype == 'float64':
+            decimals = float32_precision(series)
+            if decimals is not None:
+                COLUMN_PRECISION[col] = max(COLUMN_PRECISION.get(col, 0), decimals)
+                dtypes[col] = 'float32'
+        elif pd.api.types.is_integer_dtype(series) and series.dtype.itemsize == 8:
+            dtypes[col] = pd.to_numeric(series, downcast='unsigned' if (series >= 0).all() else 'integer').dtype
+        elif pd.api.types.is_string_dtype(series) and series.nunique() <= len(series) // 2:
+            # Categorical only pays off when keys repeat (e.g. a long frame across periods)
+            dtypes[col] = 'category'
+    return df.astype(dtypes)
+
+def as_reported(df):
+    """Widen compact columns back to float64/int64, rounding float32 ones at their recorded precision"""
+    float32_cols = [col for col in df.columns if df[col].dtype == 'float32']
+    int_cols = [col for col in df.columns
+                if pd.api.types.is_integer_dtype(df[col]) and df[col].dtype.itemsize < 8]
+    if not float32_cols and not int_cols:
+        return df
+    widened = df.astype({**{col: 'float64' for col in float32_cols}, **{col: 'int64' for col in int_cols}})
+    return widened.round({col: COLUMN_PRECISION[col] for col in float32_cols})
+
 print("="*70)
 print("🏛️ UIDAI Data Hackathon 2026 - Digital India Readiness Analysis")
 print("="*70)
@@ -103,8 +156,22 @@ df_msme_clean = df_msme_clean.rename(columns={'State/UT': 'State'})
 df_msme_clean['State'] = df_msme_clean['State'].apply(standardize_state_name)
 df_msme_clean = df_msme_clean[df_msme_clean['State'].notna()]
 
+df_pds_clean = compact_frame(df_pds_clean)
+df_aadhaar_clean = compact_frame(df_aadhaar_clean)
+df_mgnregs_clean = compact_frame(df_mgnregs_clean)
+df_msme_clean = compact_frame(df_msme_clean)
+
 print(f"   ✅ Cleaned datasets ready")
 
+if COMPACT_SCHEMA:
+    # Raw frames are fully consumed by cleaning
+    raw_frames = [df_pds_metrics, df_ration_cards, df_msme, df_mgnregs, df_aadhaar_gen,
+                  df_deleted_cards, df_transgender, df_seeding_alt]
+    freed = sum(frame.memory_usage(deep=True).sum() for frame in raw_frames)
+    del raw_frames, df_pds_metrics, df_ration_cards, df_msme, df_mgnregs, df_aadhaar_gen
+    del df_deleted_cards, df_transgender, df_seeding_alt
+    print(f"   ✅ Released raw frames: {freed / 1024:.1f} KB")
+
 # ============================================================
 # 3. CREATE MASTER DATASET
 # ============================================================
@@ -127,9 +194,19 @@ master_df = master_df.merge(
     on='State', how='left'
 )
 master_df = master_df.rename(columns={'Total': 'Total_MSMEs'})
+# Left joins turn unmatched integer columns into float64; narrow them again
+master_df = compact_frame(master_df)
 
 print(f"   ✅ Master dataset: {len(master_df)} states")
 
+if COMPACT_SCHEMA:
+    # Cleaned frames are fully consumed by the merge; only the MGNREGS frame
+    # feeds a later chart
+    clean_frames = [df_pds_clean, df_aadhaar_clean, df_msme_clean]
+    freed = sum(frame.memory_usage(deep=True).sum() for frame in clean_frames)
+    del clean_frames, df_pds_clean, df_aadhaar_clean, df_msme_clean
+    print(f"   ✅ Released cleaned frames: {freed / 1024:.1f} KB")
+
 # ============================================================
 # 4. CALCULATE DIGITAL READINESS INDEX
 # ============================================================
@@ -145,17 +222,26 @@ def normalize_score(series, higher_is_better=True):
     else:
         return ((max_val - series) / (max_val - min_val) * 100).round(2)
 
-# Calculate scores
-master_df['Aadhaar_Coverage_Capped'] = master_df['Aadhaar_Percentage'].clip(upper=100)
-master_df['Score_Aadhaar_Coverage'] = normalize_score(master_df['Aadhaar_Coverage_Capped'])
-
-master_df['PDS_Avg'] = master_df[['Ration_Card_Seeding', 'Beneficiary_Seeding', 'FPS_Automation']].mean(axis=1, skipna=True)
-master_df['Score_PDS_Readiness'] = normalize_score(master_df['PDS_Avg'])
+# Intermediate columns derived from the raw metrics: (input columns, computation).
+# They are never stored on master_df; charts and exports compute them on demand
+PDS_COLS = ['Ration_Card_Seeding', 'Beneficiary_Seeding', 'FPS_Automation']
+INTERMEDIATE_COLS = {
+    'Aadhaar_Coverage_Capped': (['Aadhaar_Percentage'], lambda df: df['Aadhaar_Percentage'].clip(upper=100)),
+    'PDS_Avg': (PDS_COLS, lambda df: df[PDS_COLS].mean(axis=1, skipna=True)),
+    'MSME_Density': (['Total_MSMEs', 'Population_2011'],
+                     lambda df: (df['Total_MSMEs'] / df['Population_2011'] * 10000).round(2)),
+}
 
-master_df['Score_MGNREGS_ABPS'] = normalize_score(master_df['ABPS_Coverage'].fillna(0))
+def intermediate(df, col):
+    """Compute an intermediate column from its inputs at full precision"""
+    inputs, compute = INTERMEDIATE_COLS[col]
+    return compute(as_reported(df[inputs]))
 
-master_df['MSME_Density'] = (master_df['Total_MSMEs'] / master_df['Population_2011'] * 10000).round(2)
-master_df['Score_MSME_Density'] = normalize_score(master_df['MSME_Density'].fillna(0))
+# Calculate scores
+master_df['Score_Aadhaar_Coverage'] = normalize_score(intermediate(master_df, 'Aadhaar_Coverage_Capped'))
+master_df['Score_PDS_Readiness'] = normalize_score(intermediate(master_df, 'PDS_Avg'))
+master_df['Score_MGNREGS_ABPS'] = normalize_score(as_reported(master_df[['ABPS_Coverage']])['ABPS_Coverage'].fillna(0))
+master_df['Score_MSME_Density'] = normalize_score(intermediate(master_df, 'MSME_Density').fillna(0))
 
 # Calculate composite index
 WEIGHTS = {
@@ -185,8 +271,68 @@ master_df = master_df.sort_values('Rank')
 
 print(f"   ✅ Digital Readiness Index calculated")
 
+def compact_master(df):
+    """Narrow the scored master frame: float32 scores and uint16 Rank.
+    The composite index stays float64 so reported values match the default mode."""
+    return compact_frame(df, skip=['Digital_Readiness_Index', 'Rank']).astype({'Rank': 'uint16'})
+
+def memory_report(df):
+    """Per-column bytes (deep) of a compact frame against the default 64-bit layout, with the reason for each dtype"""
+    rows = {}
+    for col in df.columns:
+        series = df[col]
+        wide = as_reported(df[[col]])[col]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            wide = wide.astype(series.cat.categories.dtype)
+            note = 'repeated keys'
+        elif series.dtype == 'float32':
+            note = f'exact at {COLUMN_PRECISION[col]} dp'
+        elif series.dtype == 'float64':
+            note = 'index kept at float64' if col == 'Digital_Readiness_Index' else 'float32 would lose precision'
+        elif pd.api.types.is_string_dtype(series):
+            note = 'unique keys, categorical would be larger'
+        else:
+            note = ''
+        rows[col] = {
+            'Before_Dtype': str(wide.dtype), 'Before_Bytes': wide.memory_usage(index=False, deep=True),
+            'After_Dtype': str(series.dtype), 'After_Bytes': series.memory_usage(index=False, deep=True),
+            'Note': note,
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+if COMPACT_SCHEMA:
+    print("\n🗜️ Compacting master dataset...")
+    master_df = compact_master(master_df)
+    report = memory_report(master_df)
+    print(report.to_string())
+    before_total, after_total = report['Before_Bytes'].sum(), report['After_Bytes'].sum()
+    print(f"   ✅ Master dataset: {before_total / 1024:.1f} KB -> {after_total / 1024:.1f} KB "
+          f"({(1 - after_total / before_total) * 100:.0f}% smaller)")
+
 # ============================================================
-# 5. GENERATE VISUALIZATIONS
+# 5. PEER GROUPS
+# ============================================================
+print("\n🧭 Building peer-group index...")
+
+# Scores are widened at their recorded precision, so float32 scores in compact
+# mode give the same peers, distances and exported figures
+peer_index = PeerIndex(as_reported(master_df[['State', 'Digital_Readiness_Index'] + SCORE_COLS]))
+
+start = time.perf_counter()
+peer_table = peer_index.batch_peers()
+elapsed_ms = (time.perf_counter() - start) * 1000
+print(f"   ✅ {PEER_K}-nearest peers for {len(master_df)} units in {elapsed_ms:.2f} ms "
+      f"({elapsed_ms * 1000 / len(master_df):.1f} µs/unit)")
+
+unit_archetypes, archetype_profiles = peer_index.archetypes(WEIGHTS)
+master_df['Archetype'] = unit_archetypes.astype('uint8' if COMPACT_SCHEMA else int)
+print(f"   ✅ {len(archetype_profiles)} readiness archetypes:")
+for archetype, row in archetype_profiles.iterrows():
+    print(f"      Archetype {archetype}: {int(row['Units'])} units, "
+          + ", ".join(f"{col.replace('Score_', '')} {row[col]:.0f}" for col in SCORE_COLS))
+
+# ============================================================
+# 6. GENERATE VISUALIZATIONS
 # ============================================================
 print("\n🎨 Generating visualizations...")
 
@@ -280,15 +426,40 @@ plt.savefig('assets/radar_chart.png', dpi=300, bbox_inches='tight', facecolor='w
 plt.close()
 print("   ✅ Saved: assets/radar_chart.png")
 
+# VIZ 3b: Archetype Radar Chart
+fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
+
+colors_archetype = plt.cm.RdYlGn(np.linspace(0.9, 0.1, len(archetype_profiles)))
+
+for idx, (archetype, row) in enumerate(archetype_profiles.iterrows()):
+    values = [row[col] for col in SCORE_COLS]
+    values += values[:1]
+
+    label = f"Archetype {archetype} ({int(row['Units'])} states)"
+    ax.plot(angles, values, 'o-', linewidth=2, label=label, color=colors_archetype[idx])
+    ax.fill(angles, values, alpha=0.15, color=colors_archetype[idx])
+
+ax.set_xticks(angles[:-1])
+ax.set_xticklabels(categories, size=12)
+ax.set_ylim(0, 100)
+ax.set_title('🧭 Readiness Archetypes: Cluster Profiles', 
+             fontsize=14, fontweight='bold', pad=20)
+ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
+
+plt.tight_layout()
+plt.savefig('assets/archetype_radar.png', dpi=300, bbox_inches='tight', facecolor='white')
+plt.close()
+print("   ✅ Saved: assets/archetype_radar.png")
+
 # VIZ 4: Gap Analysis
 fig, ax = plt.subplots(figsize=(14, 8))
 
 x = np.arange(len(master_df))
 width = 0.35
 
-bars1 = ax.bar(x - width/2, master_df['Aadhaar_Coverage_Capped'], width, 
+bars1 = ax.bar(x - width/2, intermediate(master_df, 'Aadhaar_Coverage_Capped'), width, 
                label='Aadhaar Coverage %', color='#1E88E5', alpha=0.8)
-bars2 = ax.bar(x + width/2, master_df['PDS_Avg'], width, 
+bars2 = ax.bar(x + width/2, intermediate(master_df, 'PDS_Avg'), width, 
                label='PDS Readiness %', color='#43A047', alpha=0.8)
 
 ax.set_xlabel('States', fontsize=12)
@@ -309,7 +480,7 @@ print("   ✅ Saved: assets/gap_analysis.png")
 # VIZ 5: Correlation Matrix
 corr_cols = ['Aadhaar_Percentage', 'Ration_Card_Seeding', 'Beneficiary_Seeding', 
              'ABPS_Coverage', 'MSME_Density']
-corr_data = master_df[corr_cols].dropna()
+corr_data = as_reported(master_df.assign(MSME_Density=intermediate(master_df, 'MSME_Density'))[corr_cols]).dropna()
 
 fig, ax = plt.subplots(figsize=(10, 8))
 correlation_matrix = corr_data.corr()
@@ -371,7 +542,7 @@ fig, ax = plt.subplots(figsize=(12, 6))
 x = np.arange(len(ne_data))
 width = 0.2
 
-ax.bar(x - 1.5*width, ne_data['Aadhaar_Coverage_Capped'], width, label='Aadhaar Coverage', color='#1E88E5')
+ax.bar(x - 1.5*width, intermediate(ne_data, 'Aadhaar_Coverage_Capped'), width, label='Aadhaar Coverage', color='#1E88E5')
 ax.bar(x - 0.5*width, ne_data['Ration_Card_Seeding'].fillna(0), width, label='Ration Card Seeding', color='#43A047')
 ax.bar(x + 0.5*width, ne_data['Beneficiary_Seeding'].fillna(0), width, label='Beneficiary Seeding', color='#7CB342')
 ax.bar(x + 1.5*width, ne_data['ABPS_Coverage'].fillna(0), width, label='ABPS Coverage', color='#FB8C00')
@@ -415,7 +586,7 @@ plt.close()
 print("   ✅ Saved: assets/distribution_analysis.png")
 
 # ============================================================
-# 6. EXPORT RESULTS
+# 7. EXPORT RESULTS
 # ============================================================
 print("\n💾 Exporting results...")
 
@@ -423,13 +594,150 @@ export_cols = ['Rank', 'State', 'Digital_Readiness_Index',
                'Aadhaar_Percentage', 'Ration_Card_Seeding', 'Beneficiary_Seeding',
                'ABPS_Coverage', 'MSME_Density',
                'Score_Aadhaar_Coverage', 'Score_PDS_Readiness', 
-               'Score_MGNREGS_ABPS', 'Score_MSME_Density']
+               'Score_MGNREGS_ABPS', 'Score_MSME_Density', 'Archetype']
 
-master_df[export_cols].to_csv('data/digital_readiness_index.csv', index=False)
+export_df = as_reported(master_df.assign(MSME_Density=intermediate(master_df, 'MSME_Density'))[export_cols])
+export_df.to_csv('data/digital_readiness_index.csv', index=False)
 print("   ✅ Exported: data/digital_readiness_index.csv")
 
+peer_table.to_csv('data/peer_groups.csv', index=False)
+print("   ✅ Exported: data/peer_groups.csv")
+
+# Versioned, compressed partitions (one per period/level) plus a diff feed
+# against the published snapshot: the values consumers hold after applying
+# every earlier diff. Scores are published once they have drifted by at least
+# the threshold from that snapshot, so skipped small changes cannot accumulate
+EXPORT_ROOT = 'data/exports'
+# The source tables carry no common reporting period, so the period is the
+# run month unless DRI_PERIOD names one
+EXPORT_PERIOD = os.environ.get('DRI_PERIOD', datetime.now().strftime('%Y-%m'))
+EXPORT_LEVEL = 'state'
+EXPORT_KEEP_RUNS = 5
+DIFF_SCORE_THRESHOLD = 0.5
+DIFF_SCORE_COLS = ['Digital_Readiness_Index', 'Score_Aadhaar_Coverage', 'Score_PDS_Readiness',
+                   'Score_MGNREGS_ABPS', 'Score_MSME_Density']
+
+def list_runs(partition_dir):
+    """Return run ids stored in a partition, oldest first"""
+    if not os.path.isdir(partition_dir):
+        return []
+    return sorted(f[len('run-'):-len('.csv.gz')] for f in os.listdir(partition_dir)
+                  if f.startswith('run-') and f.endswith('.csv.gz'))
+
+def json_value(value, decimals=None):
+    """Plain JSON number (optionally rounded) or null for a diff entry"""
+    if pd.isna(value):
+        return None
+    value = float(value) if decimals is None else round(float(value), decimals)
+    return int(value) if value.is_integer() else value
+
+def compute_run_diff(published, current, key='State', threshold=DIFF_SCORE_THRESHOLD):
+    """Compact diff of a run against the published snapshot: rank moves, score
+    drift above threshold, changes to every other exported column, and new/missing
+    units. Returns the diff and the new snapshot (the published one with the diff applied)"""
+    prev = published.assign(**{key: published[key].astype(str)}).set_index(key)
+    curr = current.assign(**{key: current[key].astype(str)}).set_index(key)
+    common = curr.index.intersection(prev.index)
+    snapshot = curr.copy()
+
+    old_rank = prev.loc[common, 'Rank'].astype(int)
+    new_rank = curr.loc[common, 'Rank'].astype(int)
+    moved = old_rank != new_rank
+    rank_changes = [{key: unit, 'old_rank': int(old_rank[unit]), 'new_rank': int(new_rank[unit])}
+                    for unit in moved[moved].index]
+
+    score_changes = []
+    for col in DIFF_SCORE_COLS:
+        old_vals = prev.loc[common, col].astype(float)
+        new_vals = curr.loc[common, col].astype(float)
+        delta = (new_vals - old_vals).round(2)
+        held = delta.abs() < threshold
+        # Unpublished drift stays in the snapshot so it is measured again next run
+        snapshot.loc[held[held].index, col] = old_vals[held]
+        for unit in delta[~held].index:
+            score_changes.append({key: unit, 'column': col, 'old': json_value(old_vals[unit], 2),
+                                  'new': json_value(new_vals[unit], 2), 'delta': float(delta[unit])})
+
+    # Remaining exported columns are published on any change, so applying the
+    # diff reproduces them exactly; a column absent from the base counts as NaN
+    value_changes = []
+    for col in curr.columns.difference(DIFF_SCORE_COLS + ['Rank'], sort=False):
+        old_vals = prev[col] if col in prev.columns else pd.Series(np.nan, index=prev.index)
+        old_vals = old_vals.loc[common].astype(float)
+        new_vals = curr.loc[common, col].astype(float)
+        changed = (old_vals != new_vals) & ~(old_vals.isna() & new_vals.isna())
+        for unit in changed[changed].index:
+            value_changes.append({key: unit, 'column': col, 'old': json_value(old_vals[unit]),
+                                  'new': json_value(new_vals[unit])})
+
+    new_units = curr.loc[curr.index.difference(prev.index)].reset_index()
+    run_diff = {
+        'rank_changes': rank_changes,
+        'score_changes': score_changes,
+        'value_changes': value_changes,
+        'new_units': json.loads(new_units.to_json(orient='records')),
+        'missing_units': sorted(prev.index.difference(curr.index)),
+    }
+    return run_diff, snapshot.reset_index()[list(current.columns)]
+
+partition_dir = os.path.join(EXPORT_ROOT, f'period={EXPORT_PERIOD}', f'level={EXPORT_LEVEL}')
+published_dir = os.path.join(EXPORT_ROOT, 'published', f'level={EXPORT_LEVEL}')
+os.makedirs(partition_dir, exist_ok=True)
+os.makedirs(published_dir, exist_ok=True)
+# Microsecond run ids keep back-to-back runs from overwriting each other;
+# the base run is still picked from ids other than this one
+run_id = datetime.now().strftime('%Y%m%dT%H%M%S%f')
+published_runs = [r for r in list_runs(published_dir) if r != run_id]
+
+run_path = os.path.join(partition_dir, f'run-{run_id}.csv.gz')
+export_df.to_csv(run_path, index=False, compression='gzip')
+print(f"   ✅ Exported: {run_path}")
+
+# The snapshot is kept per level, not per period, so a new period continues
+# the same diff chain instead of forcing consumers to reload
+base_run = published_runs[-1] if published_runs else None
+if base_run is not None:
+    published_df = pd.read_csv(os.path.join(published_dir, f'run-{base_run}.csv.gz'))
+    run_diff, snapshot_df = compute_run_diff(published_df, export_df)
+else:
+    # First run for this level: no base to diff against, so consumers
+    # load the partition file itself (base_run_id is null)
+    run_diff = {'rank_changes': [], 'score_changes': [], 'value_changes': [],
+                'new_units': [], 'missing_units': []}
+    snapshot_df = export_df
+
+snapshot_df.to_csv(os.path.join(published_dir, f'run-{run_id}.csv.gz'), index=False, compression='gzip')
+for old_run in published_runs:
+    os.remove(os.path.join(published_dir, f'run-{old_run}.csv.gz'))
+
+diff_path = os.path.join(partition_dir, f'diff-{run_id}.json')
+with open(diff_path, 'w') as f:
+    json.dump({'period': EXPORT_PERIOD, 'level': EXPORT_LEVEL, 'run_id': run_id,
+               'base_run_id': base_run, 'partition_file': os.path.basename(run_path),
+               'score_threshold': DIFF_SCORE_THRESHOLD, **run_diff}, f, indent=2)
+print(f"   ✅ Exported: {diff_path} ({len(run_diff['rank_changes'])} rank changes, "
+      f"{len(run_diff['score_changes'])} score changes, {len(run_diff['value_changes'])} value changes, "
+      f"{len(run_diff['new_units'])} new, {len(run_diff['missing_units'])} missing)")
+
+# Retention: keep only the most recent runs (and their diffs) for this level
+# across all periods, and drop period directories left empty
+level_runs = sorted(
+    (run, os.path.join(EXPORT_ROOT, period, f'level={EXPORT_LEVEL}'))
+    for period in os.listdir(EXPORT_ROOT) if period.startswith('period=')
+    for run in list_runs(os.path.join(EXPORT_ROOT, period, f'level={EXPORT_LEVEL}'))
+)
+for old_run, old_dir in level_runs[:-EXPORT_KEEP_RUNS]:
+    for name in (f'run-{old_run}.csv.gz', f'diff-{old_run}.json'):
+        old_path = os.path.join(old_dir, name)
+        if os.path.exists(old_path):
+            os.remove(old_path)
+    if not os.listdir(old_dir):
+        os.rmdir(old_dir)
+        if not os.listdir(os.path.dirname(old_dir)):
+            os.rmdir(os.path.dirname(old_dir))
+
 # ============================================================
-# 7. PRINT SUMMARY
+# 8. PRINT SUMMARY
 # ============================================================
 print("\n" + "="*70)
 print("📊 KEY METRICS AT A GLANCE")
@@ -448,8 +756,18 @@ print(f"\n⚠️ BOTTOM 5 STATES:")
 for _, row in master_df.tail(5).iterrows():
     print(f"   {row['Rank']}. {row['State']}: {row['Digital_Readiness_Index']:.1f}")
 
-total_workers = master_df['Active_Workers_Lakh'].sum()
-abps_eligible = master_df['ABPS_Eligible_Lakh'].sum()
+print(f"\n🧭 NEAREST BETTER-PERFORMING PEERS (BOTTOM 5):")
+for state in master_df.tail(5)['State'].astype(str):
+    better = peer_index.find_peers(state).query('Does_Better')
+    if len(better):
+        best = better.iloc[0]
+        print(f"   • {state} → {best['Peer']}: {best['Digital_Readiness_Index']:.1f} (distance {best['Distance']:.1f})")
+    else:
+        print(f"   • {state} → no better-performing peer among {PEER_K} nearest")
+
+workers_df = as_reported(master_df[['Active_Workers_Lakh', 'ABPS_Eligible_Lakh']])
+total_workers = workers_df['Active_Workers_Lakh'].sum()
+abps_eligible = workers_df['ABPS_Eligible_Lakh'].sum()
 print(f"\n👷 MGNREGS ABPS:")
 print(f"   • Total Active Workers: {total_workers:.1f} Lakh")
 print(f"   • ABPS Eligible Workers: {abps_eligible:.1f} Lakh")
@@ -464,7 +782,7 @@ print("\n📁 Generated Files:")
 for f in ['assets/state_rankings.png', 'assets/heatmap_matrix.png', 'assets/radar_chart.png', 
           'assets/gap_analysis.png', 'assets/correlation_matrix.png', 'assets/mgnregs_gap.png',
           'assets/ne_states_analysis.png', 'assets/distribution_analysis.png', 
-          'data/digital_readiness_index.csv']:
+          'assets/archetype_radar.png', 'data/digital_readiness_index.csv', 'data/peer_groups.csv', run_path, diff_path]:
     if os.path.exists(f):
         size = os.path.getsize(f) / 1024
         print(f"   ✅ {f} ({size:.1f} KB)")
@@ -0,0 +1,128 @@
+"""
+UIDAI Data Hackathon 2026 - Peer-group index
+Nearest-neighbour lookup of states with a similar Digital Readiness score profile
+
+Build it from the exported index and query it directly:
+
+    from peer_groups import PeerIndex
+    index = PeerIndex.from_csv('data/digital_readiness_index.csv')
+    index.find_peers('Assam', k=5)
+    index.peers_within('Assam', radius=30)
+
+or from the command line:
+
+    python peer_groups.py Assam --k 5
+    python peer_groups.py Assam --radius 30
+"""
+
+import argparse
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+from scipy.cluster.vq import kmeans2
+
+SCORE_COLS = ['Score_Aadhaar_Coverage', 'Score_PDS_Readiness', 'Score_MGNREGS_ABPS', 'Score_MSME_Density']
+PEER_K = 5
+N_ARCHETYPES = 4
+
+
+class PeerIndex:
+    """KD-tree over the four dimension scores; positions align with the rows of the source frame"""
+
+    def __init__(self, df, key='State', index_col='Digital_Readiness_Index'):
+        self.points = df[SCORE_COLS].to_numpy(dtype=np.float64)
+        self.units = df[key].astype(str).to_numpy()
+        self.dri = df[index_col].to_numpy(dtype=np.float64)
+        self.tree = cKDTree(self.points)
+
+    @classmethod
+    def from_csv(cls, path='data/digital_readiness_index.csv'):
+        """Build the index from an exported Digital Readiness Index CSV"""
+        return cls(pd.read_csv(path))
+
+    def position(self, unit):
+        """Row position of a unit, raising KeyError for unknown names"""
+        matches = np.flatnonzero(self.units == unit)
+        if not len(matches):
+            raise KeyError(f"Unknown unit: {unit}")
+        return matches[0]
+
+    def peer_frame(self, unit_idx, peer_idx, distances):
+        """Tabulate peers of a unit, flagging those with a higher readiness index"""
+        return pd.DataFrame({
+            'Peer': self.units[peer_idx],
+            'Distance': np.round(distances, 2),
+            'Digital_Readiness_Index': self.dri[peer_idx],
+            'Does_Better': self.dri[peer_idx] > self.dri[unit_idx],
+        })
+
+    def find_peers(self, unit, k=PEER_K):
+        """k units with the most similar score profile, nearest first"""
+        idx = self.position(unit)
+        distances, neighbours = self.tree.query(self.points[idx], k=min(k + 1, len(self.units)))
+        distances, neighbours = np.atleast_1d(distances), np.atleast_1d(neighbours)
+        keep = neighbours != idx
+        return self.peer_frame(idx, neighbours[keep][:k], distances[keep][:k])
+
+    def peers_within(self, unit, radius):
+        """All units whose score profile lies within radius, nearest first"""
+        idx = self.position(unit)
+        neighbours = np.array([n for n in self.tree.query_ball_point(self.points[idx], r=radius) if n != idx],
+                              dtype=int)
+        distances = np.linalg.norm(self.points[neighbours] - self.points[idx], axis=1)
+        order = np.argsort(distances)
+        return self.peer_frame(idx, neighbours[order], distances[order])
+
+    def batch_peers(self, k=PEER_K):
+        """k nearest peers for every unit in one query, as a long table"""
+        n = len(self.units)
+        distances, neighbours = self.tree.query(self.points, k=min(k + 1, n))
+        distances, neighbours = distances.reshape(n, -1), neighbours.reshape(n, -1)
+        own = np.arange(n)[:, None]
+        # Drop each unit's own entry (or the surplus neighbour when ties push it out)
+        keep = neighbours != own
+        keep &= np.cumsum(keep, axis=1) <= k
+        unit_idx = np.broadcast_to(own, neighbours.shape)[keep]
+        table = self.peer_frame(unit_idx, neighbours[keep], distances[keep])
+        table.insert(0, 'State', self.units[unit_idx])
+        table.insert(1, 'Peer_Rank', np.cumsum(keep, axis=1)[keep])
+        return table
+
+    def archetypes(self, weights, n_archetypes=N_ARCHETYPES, seed=42):
+        """k-means readiness archetypes over the score vectors, numbered so that
+        Archetype 1 has the highest weighted centroid score.
+        Returns the archetype of every unit and the centroid profile of each archetype."""
+        n_archetypes = min(n_archetypes, len(self.units))
+        centroids, labels = kmeans2(self.points, n_archetypes, seed=seed, minit='++')
+        centroid_index = centroids @ np.array([weights[col] for col in SCORE_COLS])
+        archetype_of = np.empty(n_archetypes, dtype=int)
+        archetype_of[np.argsort(-centroid_index)] = np.arange(1, n_archetypes + 1)
+        unit_archetypes = archetype_of[labels]
+
+        profiles = pd.DataFrame(centroids, columns=SCORE_COLS).round(2)
+        profiles.index = archetype_of
+        profiles = profiles.sort_index()
+        profiles['Units'] = pd.Series(unit_archetypes).value_counts().reindex(profiles.index).fillna(0).astype(int)
+        return unit_archetypes, profiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find states with a similar Digital Readiness score profile')
+    parser.add_argument('unit', help='State/UT name as it appears in the index')
+    parser.add_argument('--k', type=int, default=PEER_K, help='number of nearest peers')
+    parser.add_argument('--radius', type=float, help='return all peers within this score distance instead')
+    parser.add_argument('--csv', default='data/digital_readiness_index.csv', help='exported index to query')
+    args = parser.parse_args()
+
+    index = PeerIndex.from_csv(args.csv)
+    try:
+        if args.radius is not None:
+            peers = index.peers_within(args.unit, args.radius)
+        else:
+            peers = index.find_peers(args.unit, args.k)
+    except KeyError:
+        parser.error(f"unknown unit '{args.unit}'")
+    print(peers.to_string(index=False))
+
+if __name__ == "__main__":
+    main()